@@ -12,11 +12,19 @@ import (
 )
 
 func TestDiscNumberText(t *testing.T) {
-	if got := discNumberText(2); got != "2" {
-		t.Fatalf("discNumberText(2) = %q, want 2", got)
-	}
-	if got := discNumberText(0); got != "-" {
-		t.Fatalf("discNumberText(0) = %q, want -", got)
+	tests := []struct {
+		number int
+		want   string
+	}{
+		{2, "2"},
+		{12, "12"},
+		{0, "-"},
+		{-1, "-"},
+	}
+	for _, tt := range tests {
+		if got := discNumberText(tt.number); got != tt.want {
+			t.Errorf("discNumberText(%d) = %q, want %q", tt.number, got, tt.want)
+		}
 	}
 }
 
@@ -156,6 +156,17 @@ mux_into_mkv = true
 	}
 }
 
+// validConfig returns defaults with every required field populated, so
+// validation tests only need to set the field under test.
+func validConfig() *Config {
+	cfg := defaultConfig()
+	cfg.TMDB.APIKey = "test-key"
+	cfg.Paths.StagingDir = "/tmp/staging"
+	cfg.Paths.StateDir = "/tmp/state"
+	cfg.Paths.ReviewDir = "/tmp/review"
+	return cfg
+}
+
 func TestValidateMissingRequiredFields(t *testing.T) {
 	cfg := defaultConfig()
 	// Do not set TMDB API key.
@@ -172,11 +183,7 @@ func TestValidateMissingRequiredFields(t *testing.T) {
 }
 
 func TestValidatePassesWithRequiredFields(t *testing.T) {
-	cfg := defaultConfig()
-	cfg.TMDB.APIKey = "test-key"
-	cfg.Paths.StagingDir = "/tmp/staging"
-	cfg.Paths.StateDir = "/tmp/state"
-	cfg.Paths.ReviewDir = "/tmp/review"
+	cfg := validConfig()
 
 	err := cfg.Validate()
 	if err != nil {
@@ -185,11 +192,7 @@ func TestValidatePassesWithRequiredFields(t *testing.T) {
 }
 
 func TestValidateJellyfinConditional(t *testing.T) {
-	cfg := defaultConfig()
-	cfg.TMDB.APIKey = "test-key"
-	cfg.Paths.StagingDir = "/tmp/staging"
-	cfg.Paths.StateDir = "/tmp/state"
-	cfg.Paths.ReviewDir = "/tmp/review"
+	cfg := validConfig()
 	cfg.Jellyfin.Enabled = true
 
 	err := cfg.Validate()
@@ -206,11 +209,7 @@ func TestValidateJellyfinConditional(t *testing.T) {
 }
 
 func TestValidateSubtitlesHFToken(t *testing.T) {
-	cfg := defaultConfig()
-	cfg.TMDB.APIKey = "test-key"
-	cfg.Paths.StagingDir = "/tmp/staging"
-	cfg.Paths.StateDir = "/tmp/state"
-	cfg.Paths.ReviewDir = "/tmp/review"
+	cfg := validConfig()
 	cfg.Subtitles.Enabled = true
 	cfg.Subtitles.WhisperXVADMethod = "pyannote"
 
@@ -449,37 +448,27 @@ api_key = "from-file"
 	}
 }
 
-func TestMakeMKVRipTimeoutValidation(t *testing.T) {
-	cfg := defaultConfig()
-	cfg.TMDB.APIKey = "test-key"
-	cfg.Paths.StagingDir = "/tmp/staging"
-	cfg.Paths.StateDir = "/tmp/state"
-	cfg.Paths.ReviewDir = "/tmp/review"
-	cfg.MakeMKV.RipTimeout = -1
-
-	err := cfg.Validate()
-	if err == nil {
-		t.Fatal("Validate should fail with negative rip_timeout")
-	}
-	if !strings.Contains(err.Error(), "rip_timeout") {
-		t.Errorf("expected error about rip_timeout, got: %s", err.Error())
+func TestMakeMKVValidation(t *testing.T) {
+	tests := []struct {
+		field  string
+		mutate func(*Config)
+	}{
+		{"rip_timeout", func(c *Config) { c.MakeMKV.RipTimeout = -1 }},
+		{"min_title_length", func(c *Config) { c.MakeMKV.MinTitleLength = -5 }},
 	}
-}
-
-func TestMakeMKVMinTitleLengthValidation(t *testing.T) {
-	cfg := defaultConfig()
-	cfg.TMDB.APIKey = "test-key"
-	cfg.Paths.StagingDir = "/tmp/staging"
-	cfg.Paths.StateDir = "/tmp/state"
-	cfg.Paths.ReviewDir = "/tmp/review"
-	cfg.MakeMKV.MinTitleLength = -5
+	for _, tt := range tests {
+		t.Run(tt.field, func(t *testing.T) {
+			cfg := validConfig()
+			tt.mutate(cfg)
 
-	err := cfg.Validate()
-	if err == nil {
-		t.Fatal("Validate should fail with negative min_title_length")
-	}
-	if !strings.Contains(err.Error(), "min_title_length") {
-		t.Errorf("expected error about min_title_length, got: %s", err.Error())
+			err := cfg.Validate()
+			if err == nil {
+				t.Fatalf("Validate should fail with negative %s", tt.field)
+			}
+			if !strings.Contains(err.Error(), tt.field) {
+				t.Errorf("expected error about %s, got: %s", tt.field, err.Error())
+			}
+		})
 	}
 }
 
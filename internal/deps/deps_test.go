@@ -76,14 +76,18 @@ func TestParseLDConfig(t *testing.T) {
 	libavformat.so.61 (libc6,x86-64) => /lib/x86_64-linux-gnu/libavformat.so.61
 	libopusenc.so.0 (libc6,x86-64) => /lib/x86_64-linux-gnu/libopusenc.so.0
 `
-	if got := parseLDConfig("libavformat.so", output); got != "/lib/x86_64-linux-gnu/libavformat.so.61" {
-		t.Fatalf("parseLDConfig libavformat.so = %q", got)
-	}
-	if got := parseLDConfig("libopusenc.so", output); got != "/lib/x86_64-linux-gnu/libopusenc.so.0" {
-		t.Fatalf("parseLDConfig libopusenc.so = %q", got)
+	tests := []struct {
+		lib  string
+		want string
+	}{
+		{"libavformat.so", "/lib/x86_64-linux-gnu/libavformat.so.61"},
+		{"libopusenc.so", "/lib/x86_64-linux-gnu/libopusenc.so.0"},
+		{"libmissing.so", ""},
 	}
-	if got := parseLDConfig("libmissing.so", output); got != "" {
-		t.Fatalf("parseLDConfig libmissing.so = %q", got)
+	for _, tt := range tests {
+		if got := parseLDConfig(tt.lib, output); got != tt.want {
+			t.Errorf("parseLDConfig %s = %q, want %q", tt.lib, got, tt.want)
+		}
 	}
 }
 
@@ -9,61 +9,41 @@ import (
 )
 
 func TestParseLsblk(t *testing.T) {
-	input := []byte(`{
-		"blockdevices": [
-			{"name": "sr0", "label": "MY_DISC", "fstype": "udf", "mountpoint": "/media/cdrom"}
-		]
-	}`)
-
-	dev, err := parseLsblk(input)
-	if err != nil {
-		t.Fatalf("parseLsblk returned error: %v", err)
-	}
-	if dev.Name != "sr0" {
-		t.Errorf("Name = %q, want %q", dev.Name, "sr0")
-	}
-	if dev.Label != "MY_DISC" {
-		t.Errorf("Label = %q, want %q", dev.Label, "MY_DISC")
-	}
-	if dev.FSType != "udf" {
-		t.Errorf("FSType = %q, want %q", dev.FSType, "udf")
-	}
-	if dev.MountPoint != "/media/cdrom" {
-		t.Errorf("MountPoint = %q, want %q", dev.MountPoint, "/media/cdrom")
-	}
-}
-
-func TestParseLsblkEmpty(t *testing.T) {
-	input := []byte(`{"blockdevices": []}`)
-	_, err := parseLsblk(input)
-	if err == nil {
-		t.Fatal("parseLsblk should return error for empty blockdevices")
-	}
-}
-
-func TestParseLsblkInvalidJSON(t *testing.T) {
-	_, err := parseLsblk([]byte(`not json`))
-	if err == nil {
-		t.Fatal("parseLsblk should return error for invalid JSON")
-	}
-}
-
-func TestParseLsblkNullFields(t *testing.T) {
-	input := []byte(`{
-		"blockdevices": [
-			{"name": "sr0", "label": null, "fstype": null, "mountpoint": null}
-		]
-	}`)
-
-	dev, err := parseLsblk(input)
-	if err != nil {
-		t.Fatalf("parseLsblk returned error: %v", err)
-	}
-	if dev.Label != "" {
-		t.Errorf("Label = %q, want empty", dev.Label)
+	tests := []struct {
+		name    string
+		input   string
+		want    lsblkDevice
+		wantErr bool
+	}{
+		{
+			name:  "populated",
+			input: `{"blockdevices": [{"name": "sr0", "label": "MY_DISC", "fstype": "udf", "mountpoint": "/media/cdrom"}]}`,
+			want:  lsblkDevice{Name: "sr0", Label: "MY_DISC", FSType: "udf", MountPoint: "/media/cdrom"},
+		},
+		{
+			name:  "null fields",
+			input: `{"blockdevices": [{"name": "sr0", "label": null, "fstype": null, "mountpoint": null}]}`,
+			want:  lsblkDevice{Name: "sr0"},
+		},
+		{name: "empty blockdevices", input: `{"blockdevices": []}`, wantErr: true},
+		{name: "invalid JSON", input: `not json`, wantErr: true},
 	}
-	if dev.FSType != "" {
-		t.Errorf("FSType = %q, want empty", dev.FSType)
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			dev, err := parseLsblk([]byte(tt.input))
+			if tt.wantErr {
+				if err == nil {
+					t.Fatal("parseLsblk should return error")
+				}
+				return
+			}
+			if err != nil {
+				t.Fatalf("parseLsblk returned error: %v", err)
+			}
+			if *dev != tt.want {
+				t.Errorf("parseLsblk = %+v, want %+v", *dev, tt.want)
+			}
+		})
 	}
 }
 
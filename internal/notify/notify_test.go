@@ -33,52 +33,30 @@ func TestNilNotifierSend(t *testing.T) {
 	}
 }
 
-func TestPriority(t *testing.T) {
+func TestPriorityAndTags(t *testing.T) {
 	tests := []struct {
-		event Event
-		want  string
+		event    Event
+		priority string
+		tags     string
 	}{
-		{EventItemQueued, "default"},
-		{EventIdentificationComplete, "default"},
-		{EventRipCacheHit, "low"},
-		{EventRipComplete, "default"},
-		{EventEncodeComplete, "default"},
-		{EventReviewRequired, "high"},
-		{EventPipelineComplete, "default"},
-		{EventQueueStarted, "default"},
-		{EventQueueCompleted, "default"},
-		{EventError, "high"},
-		{EventTest, "low"},
+		{EventItemQueued, "default", "queue"},
+		{EventIdentificationComplete, "default", "identify"},
+		{EventRipCacheHit, "low", "rip,cache"},
+		{EventRipComplete, "default", "rip"},
+		{EventEncodeComplete, "default", "encode"},
+		{EventReviewRequired, "high", "review,warning"},
+		{EventPipelineComplete, "default", "complete"},
+		{EventQueueStarted, "default", "queue"},
+		{EventQueueCompleted, "default", "queue"},
+		{EventError, "high", "error"},
+		{EventTest, "low", "test"},
 	}
 	for _, tt := range tests {
-		got := priority(tt.event)
-		if got != tt.want {
-			t.Errorf("priority(%q) = %q, want %q", tt.event, got, tt.want)
+		if got := priority(tt.event); got != tt.priority {
+			t.Errorf("priority(%q) = %q, want %q", tt.event, got, tt.priority)
 		}
-	}
-}
-
-func TestTags(t *testing.T) {
-	tests := []struct {
-		event Event
-		want  string
-	}{
-		{EventItemQueued, "queue"},
-		{EventIdentificationComplete, "identify"},
-		{EventRipCacheHit, "rip,cache"},
-		{EventRipComplete, "rip"},
-		{EventEncodeComplete, "encode"},
-		{EventReviewRequired, "review,warning"},
-		{EventPipelineComplete, "complete"},
-		{EventQueueStarted, "queue"},
-		{EventQueueCompleted, "queue"},
-		{EventError, "error"},
-		{EventTest, "test"},
-	}
-	for _, tt := range tests {
-		got := tags(tt.event)
-		if got != tt.want {
-			t.Errorf("tags(%q) = %q, want %q", tt.event, got, tt.want)
+		if got := tags(tt.event); got != tt.tags {
+			t.Errorf("tags(%q) = %q, want %q", tt.event, got, tt.tags)
 		}
 	}
 }
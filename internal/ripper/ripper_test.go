@@ -130,85 +130,80 @@ func TestCacheFreshRipRecordsDiscNumber(t *testing.T) {
 	}
 }
 
-func TestSelectRipTargets_Movie(t *testing.T) {
-	h := &Handler{cfg: &config.Config{}, titleOverride: -1}
-	h.cfg.MakeMKV.MinTitleLength = 120
-
-	env := &ripspec.Envelope{
-		Metadata: ripspec.Metadata{MediaType: "movie"},
-		Titles: []ripspec.Title{
-			{ID: 0, Duration: 7200}, // 2 hours - longest
-			{ID: 1, Duration: 1800}, // 30 min
-			{ID: 2, Duration: 60},   // 1 min - below minimum
-		},
-	}
-
-	targets, err := h.selectRipTargets(testLogger(), env)
-	if err != nil {
-		t.Fatalf("unexpected error: %v", err)
-	}
-
-	if len(targets) != 1 {
-		t.Fatalf("expected 1 target, got %d", len(targets))
-	}
-	if targets[0].ID != 0 {
-		t.Errorf("expected title ID 0 (longest), got %d", targets[0].ID)
-	}
-}
-
-func TestSelectRipTargets_TV(t *testing.T) {
-	h := &Handler{cfg: &config.Config{}, titleOverride: -1}
-
-	env := &ripspec.Envelope{
-		Metadata: ripspec.Metadata{MediaType: "tv"},
-		Titles: []ripspec.Title{
-			{ID: 0, Duration: 2700},
-			{ID: 1, Duration: 2700},
-			{ID: 2, Duration: 2700},
-			{ID: 3, Duration: 30}, // not referenced by any episode
+func TestSelectRipTargets_MediaType(t *testing.T) {
+	tests := []struct {
+		name     string
+		env      ripspec.Envelope
+		minTitle int
+		wantIDs  []int
+	}{
+		{
+			name:     "movie picks longest",
+			minTitle: 120,
+			env: ripspec.Envelope{
+				Metadata: ripspec.Metadata{MediaType: "movie"},
+				Titles: []ripspec.Title{
+					{ID: 0, Duration: 7200}, // 2 hours - longest
+					{ID: 1, Duration: 1800}, // 30 min
+					{ID: 2, Duration: 60},   // 1 min - below minimum
+				},
+			},
+			wantIDs: []int{0},
 		},
-		Episodes: []ripspec.Episode{
-			{Key: "s01_001", TitleID: 0},
-			{Key: "s01_002", TitleID: 2},
+		{
+			name: "tv picks episode titles",
+			env: ripspec.Envelope{
+				Metadata: ripspec.Metadata{MediaType: "tv"},
+				Titles: []ripspec.Title{
+					{ID: 0, Duration: 2700},
+					{ID: 1, Duration: 2700},
+					{ID: 2, Duration: 2700},
+					{ID: 3, Duration: 30}, // not referenced by any episode
+				},
+				Episodes: []ripspec.Episode{
+					{Key: "s01_001", TitleID: 0},
+					{Key: "s01_002", TitleID: 2},
+				},
+			},
+			wantIDs: []int{0, 2},
 		},
-	}
-
-	targets, err := h.selectRipTargets(testLogger(), env)
-	if err != nil {
-		t.Fatalf("unexpected error: %v", err)
-	}
-
-	if len(targets) != 2 {
-		t.Fatalf("expected 2 targets, got %d", len(targets))
-	}
-	wantIDs := map[int]bool{0: true, 2: true}
-	for _, tgt := range targets {
-		if !wantIDs[tgt.ID] {
-			t.Errorf("unexpected target title ID %d", tgt.ID)
-		}
-	}
-}
-
-func TestSelectRipTargets_Unknown(t *testing.T) {
-	h := &Handler{cfg: &config.Config{}, titleOverride: -1}
-	h.cfg.MakeMKV.MinTitleLength = 120
-
-	env := &ripspec.Envelope{
-		Metadata: ripspec.Metadata{MediaType: "unknown"},
-		Titles: []ripspec.Title{
-			{ID: 0, Duration: 7200},
-			{ID: 1, Duration: 60}, // below minimum
-			{ID: 2, Duration: 3600},
+		{
+			name:     "unknown keeps titles above minimum",
+			minTitle: 120,
+			env: ripspec.Envelope{
+				Metadata: ripspec.Metadata{MediaType: "unknown"},
+				Titles: []ripspec.Title{
+					{ID: 0, Duration: 7200},
+					{ID: 1, Duration: 60}, // below minimum
+					{ID: 2, Duration: 3600},
+				},
+			},
+			wantIDs: []int{0, 2},
 		},
 	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			h := &Handler{cfg: &config.Config{}, titleOverride: -1}
+			h.cfg.MakeMKV.MinTitleLength = tt.minTitle
 
-	targets, err := h.selectRipTargets(testLogger(), env)
-	if err != nil {
-		t.Fatalf("unexpected error: %v", err)
-	}
+			targets, err := h.selectRipTargets(testLogger(), &tt.env)
+			if err != nil {
+				t.Fatalf("unexpected error: %v", err)
+			}
 
-	if len(targets) != 2 {
-		t.Fatalf("expected 2 targets, got %d", len(targets))
+			if len(targets) != len(tt.wantIDs) {
+				t.Fatalf("expected %d targets, got %d", len(tt.wantIDs), len(targets))
+			}
+			want := make(map[int]bool, len(tt.wantIDs))
+			for _, id := range tt.wantIDs {
+				want[id] = true
+			}
+			for _, tgt := range targets {
+				if !want[tgt.ID] {
+					t.Errorf("unexpected target title ID %d, want %v", tgt.ID, tt.wantIDs)
+				}
+			}
+		})
 	}
 }
 
@@ -40,6 +40,19 @@ func (h stubHandler) Run(ctx context.Context, sess *stage.Session) error {
 	return nil
 }
 
+// openTestStore opens a file-backed queue store under t.TempDir(). Workers
+// hit the store concurrently, and each pooled connection to ":memory:" would
+// see its own empty database.
+func openTestStore(t *testing.T) *queue.Store {
+	t.Helper()
+	store, err := queue.Open(filepath.Join(t.TempDir(), "queue.db"))
+	if err != nil {
+		t.Fatalf("open queue: %v", err)
+	}
+	t.Cleanup(func() { _ = store.Close() })
+	return store
+}
+
 func newTestManager(stages []PipelineStage) *Manager {
 	m := New(nil, nil, nil, slog.Default())
 	m.ConfigureStages(stages)
@@ -74,11 +87,7 @@ func TestConfigureStagesBuildsStageMap(t *testing.T) {
 }
 
 func TestCompletedItemHasAllTasksDone(t *testing.T) {
-	store, err := queue.Open(filepath.Join(t.TempDir(), "queue.db"))
-	if err != nil {
-		t.Fatalf("open queue: %v", err)
-	}
-	defer func() { _ = store.Close() }()
+	store := openTestStore(t)
 
 	item, _ := store.NewDisc("A", "fp1")
 	if err := store.MoveToStage(item, queue.StageOrganizing); err != nil {
@@ -127,11 +136,7 @@ func TestCompletedItemHasAllTasksDone(t *testing.T) {
 }
 
 func TestUserStoppedItemIsNotRecordedAsStageSuccess(t *testing.T) {
-	store, err := queue.Open(filepath.Join(t.TempDir(), "queue.db"))
-	if err != nil {
-		t.Fatalf("open queue: %v", err)
-	}
-	defer func() { _ = store.Close() }()
+	store := openTestStore(t)
 
 	item, _ := store.NewDisc("A", "fp1")
 	if err := store.MoveToStage(item, queue.StageOrganizing); err != nil {
@@ -197,11 +202,7 @@ func TestQueueCycleNotificationsRequireBacklogAndPair(t *testing.T) {
 	}))
 	defer srv.Close()
 
-	store, err := queue.Open(filepath.Join(t.TempDir(), "queue.db"))
-	if err != nil {
-		t.Fatalf("open queue: %v", err)
-	}
-	defer func() { _ = store.Close() }()
+	store := openTestStore(t)
 
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
 	manager := New(store, notify.New(srv.URL, 5, logger), nil, logger)
@@ -239,11 +240,7 @@ func TestQueueStartNotificationRetriesAfterFailure(t *testing.T) {
 	}))
 	defer srv.Close()
 
-	store, err := queue.Open(filepath.Join(t.TempDir(), "queue.db"))
-	if err != nil {
-		t.Fatalf("open queue: %v", err)
-	}
-	defer func() { _ = store.Close() }()
+	store := openTestStore(t)
 
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
 	manager := New(store, notify.New(srv.URL, 5, logger), nil, logger)
@@ -277,11 +274,7 @@ func TestQueueCompletionNotificationRetriesAfterFailure(t *testing.T) {
 	}))
 	defer srv.Close()
 
-	store, err := queue.Open(filepath.Join(t.TempDir(), "queue.db"))
-	if err != nil {
-		t.Fatalf("open queue: %v", err)
-	}
-	defer func() { _ = store.Close() }()
+	store := openTestStore(t)
 
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
 	manager := New(store, notify.New(srv.URL, 5, logger), nil, logger)
@@ -309,11 +302,7 @@ func TestQueueCompletionSuppressedWithoutStartedCycle(t *testing.T) {
 	}))
 	defer srv.Close()
 
-	store, err := queue.Open(filepath.Join(t.TempDir(), "queue.db"))
-	if err != nil {
-		t.Fatalf("open queue: %v", err)
-	}
-	defer func() { _ = store.Close() }()
+	store := openTestStore(t)
 
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
 	manager := New(store, notify.New(srv.URL, 5, logger), nil, logger)
@@ -328,11 +317,7 @@ func TestQueueCompletionSuppressedWithoutStartedCycle(t *testing.T) {
 }
 
 func TestSchedulerRunsChainedStagesAndRecordsTasks(t *testing.T) {
-	store, err := queue.Open(filepath.Join(t.TempDir(), "queue.db"))
-	if err != nil {
-		t.Fatalf("open queue: %v", err)
-	}
-	defer func() { _ = store.Close() }()
+	store := openTestStore(t)
 
 	item, _ := store.NewDisc("A", "fp1")
 
@@ -385,11 +370,7 @@ func TestSchedulerRunsChainedStagesAndRecordsTasks(t *testing.T) {
 }
 
 func TestSchedulerBudgetSerializesSameClaim(t *testing.T) {
-	store, err := queue.Open(filepath.Join(t.TempDir(), "queue.db"))
-	if err != nil {
-		t.Fatalf("open queue: %v", err)
-	}
-	defer func() { _ = store.Close() }()
+	store := openTestStore(t)
 
 	_, _ = store.NewDisc("A", "fp1")
 	_, _ = store.NewDisc("B", "fp2")
@@ -448,11 +429,7 @@ func TestSchedulerBudgetSerializesSameClaim(t *testing.T) {
 }
 
 func TestSchedulerFailureMarksTaskFailedAndStopsItem(t *testing.T) {
-	store, err := queue.Open(filepath.Join(t.TempDir(), "queue.db"))
-	if err != nil {
-		t.Fatalf("open queue: %v", err)
-	}
-	defer func() { _ = store.Close() }()
+	store := openTestStore(t)
 
 	item, _ := store.NewDisc("A", "fp1")
 
@@ -508,11 +485,7 @@ func TestSchedulerFailureMarksTaskFailedAndStopsItem(t *testing.T) {
 var errTestBoom = errors.New("boom")
 
 func TestSchedulerCancelsWorkerOnUserStop(t *testing.T) {
-	store, err := queue.Open(filepath.Join(t.TempDir(), "queue.db"))
-	if err != nil {
-		t.Fatalf("open queue: %v", err)
-	}
-	defer func() { _ = store.Close() }()
+	store := openTestStore(t)
 
 	item, _ := store.NewDisc("A", "fp1")
 
@@ -585,11 +558,7 @@ func TestSchedulerCancelsWorkerOnUserStop(t *testing.T) {
 }
 
 func TestSchedulerRunsParallelBranchesOfOneItemConcurrently(t *testing.T) {
-	store, err := queue.Open(filepath.Join(t.TempDir(), "queue.db"))
-	if err != nil {
-		t.Fatalf("open queue: %v", err)
-	}
-	defer func() { _ = store.Close() }()
+	store := openTestStore(t)
 
 	item, _ := store.NewDisc("A", "fp1")
 
@@ -673,11 +642,7 @@ func TestSchedulerRunsParallelBranchesOfOneItemConcurrently(t *testing.T) {
 // finished. Observers must read task state, not the item stage, during
 // overlap.
 func TestFinalizeItemLagsStageLabelDuringOverlap(t *testing.T) {
-	store, err := queue.Open(filepath.Join(t.TempDir(), "queue.db"))
-	if err != nil {
-		t.Fatalf("open queue: %v", err)
-	}
-	defer func() { _ = store.Close() }()
+	store := openTestStore(t)
 
 	item, _ := store.NewDisc("A", "fp1")
 	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
@@ -735,11 +700,7 @@ func TestFinalizeItemLagsStageLabelDuringOverlap(t *testing.T) {
 }
 
 func TestClaimsFuncRoutesItemsToPerItemSlots(t *testing.T) {
-	store, err := queue.Open(filepath.Join(t.TempDir(), "queue.db"))
-	if err != nil {
-		t.Fatalf("open queue: %v", err)
-	}
-	defer func() { _ = store.Close() }()
+	store := openTestStore(t)
 
 	// ClaimsFunc resolves a per-item claim (as contentIDClaims does for the
 	// gpu slot). Items A and B claim different slots and must run